@@ -376,7 +376,7 @@ def main(args):
     print('Parsing in Input Files...')
     tilegrid = parse_tilegrid(design.part)
     # Parse in a frame list for the part
-    frame_list = [frame[0] for frame in get_frame_list(design.part)]
+    frame_list = get_frame_list(design.part)[1]
     # Parse in the fault bit information
     bit_groups = parse_fault_bits(args.fault_bits)
 
@@ -31,48 +31,43 @@
         - List of all design bits in the format "bit_[base_frame]_[word_offset]_[bit_offset]"
 '''
 
+import json
+import mmap
+import numpy as np
 from lib.tile import get_xray_dir
 
+# Numba is optional, the high bit scan falls back to a numpy implementation when it is not installed
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# The number of words in a frame
+FRAME_LENGTH = 101
+
+# Mask applied to every word of a frame. The first 13 bits of the 51st word per frame are reserved
+# for the "horizontal clock row" in series-7, so they are cleared instead of checked bit by bit
+WORD_MASKS = np.full(FRAME_LENGTH, 0xFFFFFFFF, dtype=np.uint32)
+WORD_MASKS[50] = 0xFFFFE000
+
+# Zero-padded strings for every word offset and bit offset in a frame, used to format bit addresses
+WORD_STR = tuple(f'{i:03d}' for i in range(FRAME_LENGTH))
+BIT_STR = tuple(f'{i:02d}' for i in range(32))
+
+# ASCII characters of the zero-padded offsets and of the pieces of a .bits line ("bit_[frame]_[word]_[bit]\n"),
+# used to write the lines straight into a byte array
+WORD_CHARS = np.frombuffer(''.join(WORD_STR).encode('ascii'), dtype=np.uint8).reshape(-1, 3)
+BIT_CHARS = np.frombuffer(''.join(BIT_STR).encode('ascii'), dtype=np.uint8).reshape(-1, 2)
+BIT_PREFIX_CHARS = np.frombuffer(b'bit_', dtype=np.uint8)
+BIT_LINE_LENGTH = 20
+
 #################################################
 #                Helper functions               # 
 #################################################
 
-def parse_word(bitfile):
-    '''
-        Reads in one 32-bit word from the bitstream
-            Arguments: The opened bitstream file
-            Returns: List containing each bit starting at the LSB
-    '''
-
-    # Parse in 4 bytes (one 32-bit word) in integer form
-    word_ints = []
-    for i in range(4):
-        byte = bitfile.read(1)
-        word_ints.append(ord(byte))
-
-    # Generate list of 32 bits in the word (LSB = index 0). The list is reversed
-    # because the least significant byte comes last in the word
-    word_bits = []
-    for byte in reversed(word_ints):
-        for i in range(8):
-            word_bits.append((byte >> i) & 1)
-
-    return word_bits
-
-
-def bits_to_int(binary:list):
-    '''
-        Converts the binary representation of a number to its decimal form
-            Arguments: List of each bit in the number
-            Returns: Integer of the binary's decimal value
-    '''
-
-    int_value = 0
-    for i, bit in enumerate(binary):
-        int_value = int_value + bit*(2**i)
-    return int_value
-
-
 def read_bytes_ascii(bitfile):
     '''
         Looks at the next two bytes in the bitstream to determine the length of the field
@@ -82,23 +77,11 @@ def read_bytes_ascii(bitfile):
     '''
 
     # Read two bytes from the bitstream, which specify the number of bytes in the next field
-    two_bytes = [ord(bitfile.read(1)), ord(bitfile.read(1))]
-
-    # Convert bytes to binary
-    read_len_bits = []
-    for curr_byte in reversed(two_bytes):
-        for i in range(8):
-            read_len_bits.append((curr_byte >> i) & 1)
-
-    # Convert binary to decimal and read number of bytes specified      
-    read_len = bits_to_int(read_len_bits)
-
-    # Parse part name from the number of bytes specified
-    field_str = '' 
-    for _ in range(read_len):
-        curr_byte = ord(bitfile.read(1))
-        field_str += chr(curr_byte)
-    
+    read_len = int.from_bytes(bitfile.read(2), 'big')
+
+    # Read the number of bytes specified in one call, latin-1 maps each byte to the character of the same value
+    field_str = bitfile.read(read_len).decode('latin-1')
+
     return field_str
 
 ##################################################
@@ -131,45 +114,60 @@ def find_config_packet(bitfile):
     if part_name[0] == '7':
         part_name = "xc" + part_name + "-1"
 
-    # Decimal form of the sync word 0xAA995566
-    SYNC_WORD = 2862175590
-    sync_word_found = False
-
-    # Read bytes until the sync word is found
-    while not sync_word_found:
-        byte = bitfile.read(1)
-        # Check if current byte is equal to first byte of sync word (0xAA = 170)    
-        if ord(byte) == 170:
-            # Move back one byte in the file and check if the whole word is equal to the sync word
-            bitfile.seek(-1, 1)
-            if bits_to_int(parse_word(bitfile)) == SYNC_WORD:
-                sync_word_found = True
+    # Sync word 0xAA995566 as it appears in the bitstream
+    SYNC_WORD = b'\xAA\x99\x55\x66'
+
+    # Size of the chunks the bitstream is searched in for the sync word
+    SYNC_CHUNK_SIZE = 1 << 16
+
+    # Search through the bitstream a chunk at a time until the sync word is found
+    chunk_start = bitfile.tell()
+    chunk = bitfile.read(SYNC_CHUNK_SIZE)
+    sync_index = chunk.find(SYNC_WORD)
+    while sync_index == -1:
+        next_chunk = bitfile.read(SYNC_CHUNK_SIZE)
+        if not next_chunk:
+            raise Exception('Unrecognized bitstream format')
+        # Keep the last 3 bytes of the current chunk in case the sync word spans both chunks
+        chunk_tail = chunk[-3:]
+        chunk_start += len(chunk) - len(chunk_tail)
+        chunk = chunk_tail + next_chunk
+        sync_index = chunk.find(SYNC_WORD)
+
+    # Move to the first word after the sync word
+    bitfile.seek(chunk_start + sync_index + 4)
 
     in_config_data    = False
     type_2_fdri_write = False
     packet_2_length   = None
-    
+
     # Search for the start of the type 2 packet, which is where the configuration frames are
     while not in_config_data:
-        word = parse_word(bitfile)
+        header_bytes = bitfile.read(4)
+        if len(header_bytes) < 4:
+            raise Exception('Unrecognized bitstream format')
+
+        # Packet headers are stored MSB first, the packet type is held in bits [31:29]
+        header = int.from_bytes(header_bytes, 'big')
+        packet_type = header >> 29
+
         # If type 2 packet header found, leave loop
-        if word[-3:] == [0, 1, 0] and type_2_fdri_write:
-            packet_2_length = sum([b<<i for i, b in enumerate(word[:27])])
+        if packet_type == 2 and type_2_fdri_write:
+            packet_2_length = header & 0x7FFFFFF
             in_config_data = True
         # Some other bitstream content
         else:
             # FDRI write not yet found
             type_2_fdri_write = False
-            
+
             # If type 1 packet header found, parse packet
-            if word[-3:] == [1, 0, 0]:
-                packet_1_length = sum([b<<i for i, b in enumerate(word[:11])])
-                packet_1_addr   = sum([b<<i for i, b in enumerate(word[13:27])])
-                packet_1_opcode = sum([b<<i for i, b in enumerate(word[27:29])])
-                packet_1_data   = []
-                for i in range(packet_1_length):
-                    packet_1_data.append(parse_word(bitfile))
-                    
+            if packet_type == 1:
+                packet_1_length = header & 0x7FF
+                packet_1_addr   = (header >> 13) & 0x3FFF
+                packet_1_opcode = (header >> 27) & 0x3
+                # The packet's data words are not needed, skip over them
+                bitfile.read(packet_1_length*4)
+
                 # the typical FDRI write is a type-1 packet containing FDRI and length 0
                 # followed by a type-2 packet containing the configuration frames
                 type_2_fdri_write = packet_1_opcode == 2 and packet_1_addr == 2 and packet_1_length == 0
@@ -182,7 +180,7 @@ def get_frame_list(part:str):
     '''
         Parses the part.json file to generate a frame list for the 7-series part
             Arguments: String of the part's name
-            Returns: List containing each frame address in both binary and hexadecimal formats
+            Returns: Array of each frame address and a parallel list of their hexadecimal strings
     '''
 
     # The binary form of a Series-7 frame address is as follows:
@@ -193,15 +191,12 @@ def get_frame_list(part:str):
     #    [16:7] -- Column Address
     #     [6:0] -- Minor Address
 
-    HALF_SCOPE = 2
-    ROW_SCOPE = 4
-    BUS_SCOPE = 6
-    COL_SCOPE = 8
-    FRAME_COUNT_SCOPE = 9
+    # Values of the top/bottom bit and block type fields for each half and bus in the part.json
+    HALF_BITS = {"top" : 0, "bottom" : 1}
+    BUS_TYPES = {"CLB_IO_CLK" : 0, "BLOCK_RAM" : 1, "CFG_CLB" : 2}
 
-    frames = []
-    curr_addr = [0] * 32
-    curr_scope = 0
+    frame_addrs = []
+    frame_hexes = []
 
     # Determine the family of the series 7 part
     if 'xc7a' in part:
@@ -213,167 +208,283 @@ def get_frame_list(part:str):
     if 'xc7z' in part:
         family = "zynq7"
 
-    # Open the part.json file for the part
+    # Parse in the part.json file for the part
     with open(f"{get_xray_dir()}/{family}/{part}/part.json", "r") as p_j:
-        
-        for line in p_j:           
-            # Set corresponding bit for whether the frame's row is in the top or bottom half
-            if curr_scope == HALF_SCOPE:
-                if "top" in line:
-                    curr_addr[22] = 0
-                if "bottom" in line:
-                    curr_addr[22] = 1
-
-            # Set bits corresponding to the row number
-            if curr_scope == ROW_SCOPE:
-                row_num = line.split('"')[1::2]
-                if row_num:
-                    for i, index in enumerate(range(17, 22)):
-                        curr_addr[index] = (int(row_num[0]) >> i) & 1
-
-            # Set bits corresponding to the bus / block type
-            if curr_scope == BUS_SCOPE:
-                if "CLB_IO_CLK" in line:                    
-                    curr_addr[23:26] = reversed([0, 0, 0])
-                if "BLOCK_RAM" in line:
-                    curr_addr[23:26] = reversed([0, 0, 1])
-                if "CFG_CLB" in line:
-                    curr_addr[23:26] = reversed([0, 1, 0])
-
-            # Set bits corresponding to the column number
-            if curr_scope == COL_SCOPE:
-                col_num = line.split('"')[1::2]
-                if col_num:
-                    for i, index in enumerate(range(7, 17)):
-                        curr_addr[index] = (int(col_num[0]) >> i) & 1
-
-            # Create the number of frames specified with the current position data (row, column, etc.)
-            # and add those frames to the list
-            if curr_scope == FRAME_COUNT_SCOPE:
-                if "}" not in line:
-                    num_frames = int(line.strip().split(" ")[1])
-                    for minor_addr in range(num_frames):
-                        for index in range(7):
-                            curr_addr[index] = (minor_addr >> index) & 1
-                        
-                        # Adding the hexadecimal and binary forms of the address to a list and adding
-                        # that list to the frames list
-                        frame_addr_hex = hex(bits_to_int(curr_addr)).lstrip("0x").rjust(8, "0")
-                        frames.append([frame_addr_hex, curr_addr.copy()])
-
-
-            # Increment curr_scope counter when scope changes
-            if "{" in line:
-                curr_scope += 1
-            # Decrement curr_scope counter when scope changes
-            if "}" in line:
-                curr_scope -= 1
-
-
-    return sorted(frames)
-
-
-def parse_config_packet(bitfile, config_packet_length:int, frames:list):
+        part_info = json.load(p_j)
+
+    # Walk through every half, row, bus and column of the part, creating the number of frames
+    # specified for each column with its position data
+    for half, half_info in part_info["global_clock_regions"].items():
+        half_addr = HALF_BITS[half] << 22
+
+        for row_num, row_info in half_info["rows"].items():
+            row_addr = half_addr | ((int(row_num) & 0x1F) << 17)
+
+            for bus, bus_info in row_info["configuration_buses"].items():
+                # Skip any bus that is not one of the series-7 block types
+                if bus not in BUS_TYPES:
+                    continue
+                bus_addr = row_addr | (BUS_TYPES[bus] << 23)
+
+                for col_num, col_info in bus_info["configuration_columns"].items():
+                    col_addr = bus_addr | ((int(col_num) & 0x3FF) << 7)
+
+                    for minor_addr in range(col_info["frame_count"]):
+                        frame_addr = col_addr | (minor_addr & 0x7F)
+
+                        # Add the integer and hexadecimal forms of the address to the frame lists
+                        frame_addrs.append(frame_addr)
+                        frame_hexes.append(f'{frame_addr:08x}')
+
+    # Sort the frames by address, putting the hex strings in the same order
+    frame_addrs = np.array(frame_addrs, dtype=np.uint32)
+    frame_order = np.argsort(frame_addrs)
+    frame_hexes = np.array(frame_hexes)[frame_order].tolist()
+
+    return frame_addrs[frame_order], frame_hexes
+
+
+def get_frame_indices(frame_addrs:np.ndarray):
     '''
-        Parses the main configuration packet for all high bits
-            Arguments: The opened bitstream file and the list of frame addresses
-            Returns: List of all high bits in the configuration packet
+        Determines the position of each frame within the configuration data, which has 2 frames
+        of padding at every row change
+            Arguments: Sorted array of frame addresses
+            Returns: Array of the index of each frame within the configuration data
+    '''
+
+    # Find the frames where the row (top/bottom bit and row address, [22:17]) changes
+    row_changes = np.zeros(len(frame_addrs), dtype=np.int32)
+    row_changes[1:] = ((frame_addrs[1:] ^ frame_addrs[:-1]) & 0x7E0000) != 0
+
+    # Each frame is shifted by 2 frames for every row change up to and including it
+    return np.arange(len(frame_addrs), dtype=np.int32) + 2*np.cumsum(row_changes, dtype=np.int32)
+
+
+@njit(cache=True)
+def load_word(config_packet, pos, word_offset):
+    '''
+        Assembles one word of a frame from its bytes and clears its reserved bits (compiled with Numba)
+            Arguments: Array of the config packet's bytes, position of the word's first byte, offset
+                       of the word in its frame
+            Returns: Integer value of the masked word
+    '''
+
+    # The most significant byte comes first in the word
+    word = ((np.int64(config_packet[pos]) << 24) | (np.int64(config_packet[pos+1]) << 16)
+            | (np.int64(config_packet[pos+2]) << 8) | np.int64(config_packet[pos+3]))
+
+    return word & WORD_MASKS[word_offset]
+
+
+@njit(cache=True)
+def scan_frames(config_packet, frame_indices):
+    '''
+        Scans the given frames of the configuration packet for high bits (compiled with Numba)
+            Arguments: Array of the config packet's bytes, array of the packet frame index of each frame
+            Returns: Array of the high bits packed as (frame << 12) | (word_offset << 5) | bit_offset
+    '''
+
+    # Count the high bits first so the output array can be allocated up front
+    num_bits = 0
+    for frame in range(frame_indices.shape[0]):
+        frame_start = frame_indices[frame] * FRAME_LENGTH * 4
+        for word_offset in range(FRAME_LENGTH):
+            word = load_word(config_packet, frame_start + word_offset*4, word_offset)
+            while word:
+                word &= word - 1
+                num_bits += 1
+
+    bits = np.empty(num_bits, dtype=np.uint64)
+    num_bits = 0
+    for frame in range(frame_indices.shape[0]):
+        frame_start = frame_indices[frame] * FRAME_LENGTH * 4
+        for word_offset in range(FRAME_LENGTH):
+            word = load_word(config_packet, frame_start + word_offset*4, word_offset)
+            for bit_offset in range(32):
+                if (word >> bit_offset) & 1:
+                    bits[num_bits] = (frame << 12) | (word_offset << 5) | bit_offset
+                    num_bits += 1
+
+    return bits
+
+
+def scan_frames_np(config_packet, frame_indices):
+    '''
+        Scans the given frames of the configuration packet for high bits (fallback when Numba is not installed)
+            Arguments: Array of the config packet's bytes, array of the packet frame index of each frame
+            Returns: Array of the high bits packed as (frame << 12) | (word_offset << 5) | bit_offset
+    '''
+
+    # Read the words of the given frames (the most significant byte comes first in each word) and
+    # clear the reserved bits
+    frame_words = config_packet.view('>u4').reshape(-1, FRAME_LENGTH)[frame_indices] & WORD_MASKS
+
+    # Unpack every word into its 32 bits (LSB = index 0) in one pass
+    frame_bytes = frame_words.astype('<u4').view(np.uint8).reshape(-1, FRAME_LENGTH, 4)
+    frame_bits = np.unpackbits(frame_bytes, axis=2, bitorder='little')
+
+    # Find the frame, word and bit offsets of every high bit in the frames
+    frames, word_offsets, bit_offsets = np.nonzero(frame_bits)
+
+    return (frames.astype(np.uint64) << 12) | (word_offsets.astype(np.uint64) << 5) | bit_offsets.astype(np.uint64)
+
+
+@njit(cache=True)
+def format_bits(packed_bits, frame_chars):
+    '''
+        Writes the .bits file line of every packed high bit into one byte array (compiled with Numba)
+            Arguments: Array of packed high bits, array of the 8 hex characters of each frame address
+            Returns: Array of the ASCII characters of all the lines
+    '''
+
+    ascii_bits = np.empty(packed_bits.shape[0] * BIT_LINE_LENGTH, dtype=np.uint8)
+
+    for i in range(packed_bits.shape[0]):
+        bit = np.int64(packed_bits[i])
+        frame = bit >> 12
+        word_offset = (bit >> 5) & 0x7F
+        bit_offset = bit & 0x1F
+
+        # Write "bit_" followed by each field of the address and its separator
+        pos = i * BIT_LINE_LENGTH
+        for j in range(4):
+            ascii_bits[pos+j] = BIT_PREFIX_CHARS[j]
+        for j in range(8):
+            ascii_bits[pos+4+j] = frame_chars[frame, j]
+        ascii_bits[pos+12] = 95     # '_'
+        for j in range(3):
+            ascii_bits[pos+13+j] = WORD_CHARS[word_offset, j]
+        ascii_bits[pos+16] = 95     # '_'
+        for j in range(2):
+            ascii_bits[pos+17+j] = BIT_CHARS[bit_offset, j]
+        ascii_bits[pos+19] = 10     # '\n'
+
+    return ascii_bits
+
+
+def format_bits_np(packed_bits, frame_chars):
+    '''
+        Writes the .bits file line of every packed high bit into one byte array (fallback when Numba is not installed)
+            Arguments: Array of packed high bits, array of the 8 hex characters of each frame address
+            Returns: Array of the ASCII characters of all the lines
+    '''
+
+    # Fill in each column of the lines for all the bits at once
+    ascii_bits = np.empty((packed_bits.shape[0], BIT_LINE_LENGTH), dtype=np.uint8)
+    ascii_bits[:, 0:4] = BIT_PREFIX_CHARS
+    ascii_bits[:, 4:12] = frame_chars[packed_bits >> np.uint64(12)]
+    ascii_bits[:, 12] = ord('_')
+    ascii_bits[:, 13:16] = WORD_CHARS[(packed_bits >> np.uint64(5)) & np.uint64(0x7F)]
+    ascii_bits[:, 16] = ord('_')
+    ascii_bits[:, 17:19] = BIT_CHARS[packed_bits & np.uint64(0x1F)]
+    ascii_bits[:, 19] = ord('\n')
+
+    return ascii_bits.reshape(-1)
+
+
+def check_config_packet(config_packet_length:int, frame_indices:np.ndarray):
+    '''
+        Checks that the main configuration packet holds exactly the frames of the part, exiting if not
+            Arguments: Number of words in the config packet, array of the packet frame index of each frame
     '''
 
-    # The number of words in a frame
-    FRAME_LENGTH = 101
-    
-    
     # check if config packet is multiple of frame length
     if config_packet_length % FRAME_LENGTH != 0:
         print("ERROR: Config packet length must be multiple of frame length")
         exit()
-        
-    # frames remaining to be parsed
-    frames_remaining = config_packet_length
-    
-    # List of high bits
-    bits = []
-    # Keep track of the previous frame so a row change can be detected
-    prev_frame = frames[0].copy()
 
-    # Iterate through each frame in the frame list
-    for frame in frames:
+    # now, only two dummy frames should remain after the last frame in the config packet
+    if config_packet_length // FRAME_LENGTH - (frame_indices[-1] + 1) != 2:
+        print("ERROR: Config packet not fully parsed.")
+        exit()
 
-        # Skip 2 frames worth of bits whenever the row changes
-        if prev_frame[1][17:23] != frame[1][17:23]:
-            frames_remaining -= FRAME_LENGTH*2
-            for i in range(FRAME_LENGTH*2):
-                parse_word(bitfile)
 
-        # Iterate for the number of words specified for this architecture's frame
-        for word_offset in range(FRAME_LENGTH):
+def parse_config_packet(config_packet:np.ndarray, frame_indices:np.ndarray, frame_hexes:list):
+    '''
+        Parses the main configuration packet for all high bits. The packet must already have been
+        checked with check_config_packet, the frames are read without any bounds checking.
+            Arguments: Array of the configuration packet's bytes, array of the packet frame index of each
+                       frame and the list of the frames' hexadecimal addresses
+            Returns: Bytes of the .bits file lines of all high bits in the configuration packet
+    '''
 
-            frames_remaining -= 1
-            word = parse_word(bitfile)
-            
-            # Iterate through each bit in the word
-            for bit_offset, bit in enumerate(word):
-                # The first 13 bits of the 51st word per frame are reserved for the "horizontal clock row" in series-7
-                in_clock_row_bits = (word_offset == 50 and bit_offset <= 12)
-                # Add every high bit to the bits list
-                if bit == 1 and not in_clock_row_bits:
-                    word_offset_str = str(word_offset).rjust(3, "0")
-                    bit_offset_str = str(bit_offset).rjust(2, "0")
-                    bits.append(f'bit_{frame[0]}_{word_offset_str}_{bit_offset_str}')
-                    
-        prev_frame = frame.copy()
-
-    # now, only two dummy frames should remain to be read from the config packet
-    if frames_remaining != 2*FRAME_LENGTH:
-        print("ERROR: Config packet not fully parsed.")
-        exit()
+    # ASCII characters of each frame's hexadecimal address
+    frame_chars = np.frombuffer(''.join(frame_hexes).encode('ascii'), dtype=np.uint8).reshape(-1, 8)
 
-    return bits
+    # Find every high bit in the frames as packed integers, then write them all out in a single pass
+    if HAS_NUMBA:
+        packed_bits = scan_frames(config_packet, frame_indices)
+        ascii_bits = format_bits(packed_bits, frame_chars)
+    else:
+        packed_bits = scan_frames_np(config_packet, frame_indices)
+        ascii_bits = format_bits_np(packed_bits, frame_chars)
+
+    return ascii_bits.tobytes()
 
 ##################################################
 #                 Main Function                  #
 ##################################################
 
-def get_high_bits(bitstream:str):
+def get_high_bits_ascii(bitstream:str):
     '''
-        Generates a list of all the high bits in a bitstream's main configuration packet
+        Generates the .bits file contents for all the high bits in a bitstream's main configuration packet
             Arguments: The bitstream's file path
-            Returns: List of all design bits
+            Returns: Bytes of all design bits, one per line
     '''
 
     # Begin reading the bitstream
-    with open(bitstream, "rb") as bitfile:
+    with open(bitstream, "rb", buffering=1<<20) as bitfile:
         
         # Read through header and beginning parts of bitfile, get part name and config packet length along the way
         part, config_packet_length = find_config_packet(bitfile)
 
-        # Get a list of all the frames for the part. Each frame is a list with the hexadecimal
-        # and binary forms of the frame address for convenience.
+        # Get all the frames for the part as an array of addresses and a list of the
+        # corresponding hexadecimal strings
         if "xc7" in part:
-            frames = get_frame_list(part)
+            frame_addrs, frame_hexes = get_frame_list(part)
         else:
             print("ERROR: Only Series-7 parts are supported by BFAT")
             exit()
 
-        # Parses the configuration packet and determines the addresses of high bits in the bitstream
-        bits = parse_config_packet(bitfile, config_packet_length, frames)
+        # Find where each frame is in the config packet and make sure the packet holds all of them
+        # before any of it is read
+        frame_indices = get_frame_indices(frame_addrs)
+        check_config_packet(config_packet_length, frame_indices)
+
+        # Map the bitstream into memory so the configuration packet can be parsed without copying it.
+        # The map is not closed explicitly, it is released along with the last array viewing it, so a
+        # failed close can never hide an error raised while parsing
+        bitstream_map = mmap.mmap(bitfile.fileno(), 0, access=mmap.ACCESS_READ)
+        config_packet = np.frombuffer(bitstream_map, dtype=np.uint8, count=config_packet_length*4,
+                                      offset=bitfile.tell())
+
+    # Parses the configuration packet and determines the addresses of high bits in the bitstream
+    bits = parse_config_packet(config_packet, frame_indices, frame_hexes)
 
     return bits
 
+
+def get_high_bits(bitstream:str):
+    '''
+        Generates a list of all the high bits in a bitstream's main configuration packet
+            Arguments: The bitstream's file path
+            Returns: List of all design bits
+    '''
+
+    return get_high_bits_ascii(bitstream).decode('ascii').split()
+
 def main(args):
     '''
         Main function: Creates a readable list of the high bits in the provided bistream
         and writes it to a corresponding .bits file.
     '''
 
-    # Run bitread to generate a list of the design bits
-    bits = get_high_bits(args.bitstream)
+    # Run bitread to generate the lines of the design bits
+    bits = get_high_bits_ascii(args.bitstream)
 
-    # Output the list to a .bits file if running the script by itself
-    with open(f'{args.bitstream}s', "w") as bits_file:
-        for bit in bits:
-            bits_file.write(bit + "\n")
+    # Output the lines to a .bits file if running the script by itself
+    with open(f'{args.bitstream}s', "wb") as bits_file:
+        bits_file.write(bits)
 
 if __name__ == "__main__":
     import argparse
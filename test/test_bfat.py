@@ -25,7 +25,10 @@
 
 import os
 import json
+import random
+import struct
 import subprocess
+import pytest
 import matplotlib.pyplot as plt
 
 # Add bfat root directory to the module import path
@@ -228,6 +231,56 @@ def test_bitread():
         for line in bits:
             assert 'bit_' in line or line == '\n'
 
+def test_bitread_numpy_fallback(tmp_path, monkeypatch):
+    '''
+        Tests that the numpy fallback of bitread's configuration packet parsing gives
+        the same bits as the Numba implementation
+    '''
+
+    import numpy as np
+    import bitread
+
+    bitstream, xray_dir, bits = gen_test_bitstream(tmp_path)
+    monkeypatch.setattr(bitread, 'get_xray_dir', lambda: xray_dir)
+
+    # Read in the config packet and the frames of the test bitstream's part
+    with open(bitstream, 'rb') as bitfile:
+        part, config_packet_length = bitread.find_config_packet(bitfile)
+        config_packet = np.frombuffer(bitfile.read(config_packet_length*4), dtype=np.uint8)
+
+    frame_addrs, frame_hexes = bitread.get_frame_list(part)
+    frame_indices = bitread.get_frame_indices(frame_addrs)
+
+    # Parse the config packet with each implementation
+    numba_bits = bitread.parse_config_packet(config_packet, frame_indices, frame_hexes)
+    monkeypatch.setattr(bitread, 'HAS_NUMBA', False)
+    numpy_bits = bitread.parse_config_packet(config_packet, frame_indices, frame_hexes)
+
+    assert numpy_bits == numba_bits
+    assert numpy_bits.decode('ascii').split() == bits
+
+def test_bitread_packet_length_errors(tmp_path, monkeypatch, capsys):
+    '''
+        Tests that bitread exits cleanly with an error message when the configuration
+        packet length does not match the part's frames
+    '''
+
+    import bitread
+
+    # Config packets one word and one frame longer than the part's frames respectively
+    length_errors = {1 : 'Config packet length must be multiple of frame length',
+                     101 : 'Config packet not fully parsed'}
+
+    for extra_words, error_msg in length_errors.items():
+        bitstream, xray_dir, _ = gen_test_bitstream(tmp_path, extra_words)
+        monkeypatch.setattr(bitread, 'get_xray_dir', lambda: xray_dir)
+
+        # The error should exit bitread rather than raise any other exception
+        with pytest.raises(SystemExit):
+            bitread.get_high_bits(bitstream)
+
+        assert error_msg in capsys.readouterr().out
+
 def test_bfat(dcp):
     '''
         Tests the functionality of the BFAT tool using the Rapidwright
@@ -405,6 +458,64 @@ class UnitTestArgs():
 
         self.num_bits = None
 
+def gen_test_bitstream(test_dir, extra_words:int=0):
+    '''
+        Generates a small Series-7 bitstream and the part.json of its part for bitread unit tests
+            Arguments: Directory to write the files to, number of extra words to add to the config packet
+            Returns: Path of the bitstream, path of the X-Ray database and list of the bitstream's high bits
+    '''
+
+    FRAME_LENGTH = 101
+    rand = random.Random(0)
+
+    # Part with 2 rows of 2 columns in the top half, each column having 3 CLB_IO_CLK frames
+    cols = {str(col) : {'frame_count' : 3} for col in range(2)}
+    rows = {str(row) : {'configuration_buses' : {'CLB_IO_CLK' : {'configuration_columns' : cols}}} for row in range(2)}
+    part_info = {'global_clock_regions' : {'top' : {'rows' : rows}}}
+
+    part_dir = test_dir / 'artix7' / 'xc7a35tcpg236-1'
+    part_dir.mkdir(parents=True, exist_ok=True)
+    with open(part_dir / 'part.json', 'w') as p_j:
+        json.dump(part_info, p_j, indent=4)
+
+    # Generate each frame's words along with the high bits they hold
+    words = []
+    bits = []
+    for row in range(2):
+        # 2 padding frames begin every row after the first
+        if row:
+            words += [rand.getrandbits(32) for _ in range(FRAME_LENGTH*2)]
+
+        for col in range(2):
+            for minor in range(3):
+                frame_addr = (row << 17) | (col << 7) | minor
+                for word_offset in range(FRAME_LENGTH):
+                    word = rand.getrandbits(32) & rand.getrandbits(32)
+                    words.append(word)
+                    for bit_offset in range(32):
+                        # The first 13 bits of the 51st word are reserved and never reported
+                        if (word >> bit_offset) & 1 and not (word_offset == 50 and bit_offset <= 12):
+                            bits.append(f'bit_{frame_addr:08x}_{word_offset:03d}_{bit_offset:02d}')
+
+    # 2 dummy frames end the config packet
+    words += [rand.getrandbits(32) for _ in range(FRAME_LENGTH*2 + extra_words)]
+
+    # Header fields, then the sync word and the FDRI write holding the config packet
+    def field(data:bytes):
+        return struct.pack('>H', len(data)) + data
+
+    bitstream_bytes = field(bytes(9)) + field(b'a') + field(b'test;UserID=0XFFFFFFFF\0')
+    bitstream_bytes += b'b' + field(b'7a35tcpg236\0')
+    bitstream_bytes += bytes.fromhex('FFFFFFFF000000BB11220044FFFFFFFFAA99556620000000')
+    bitstream_bytes += bytes.fromhex('30004000') + struct.pack('>I', 0x50000000 | len(words))
+    bitstream_bytes += b''.join(struct.pack('>I', word) for word in words)
+
+    bitstream = test_dir / 'test.bit'
+    with open(bitstream, 'wb') as bit_f:
+        bit_f.write(bitstream_bytes)
+
+    return str(bitstream), str(test_dir), bits
+
 def parse_fault_report_contents(fault_report:str):
     '''
         Parses in the provided fault report from running the BFAT tool and gets the
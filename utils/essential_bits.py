@@ -38,7 +38,7 @@ import sys
 # Add the parent directory of this file (bfat root) to the interpreter's path
 sys.path.append(f'{"/".join(__file__.split("/")[:-1])}/..')
 
-from bitread import get_frame_list
+from bitread import get_frame_list, get_frame_indices, WORD_STR, BIT_STR
 
 
 def parse_ebd_file(eb_file:str):
@@ -80,30 +80,27 @@ def parse_ebd_file(eb_file:str):
             print('Unrecognized file format, part name could not be found in header')
             return []
 
-        frame_list = get_frame_list(part)
+        frame_addrs, frame_hexes = get_frame_list(part)
 
         # The number of words in a frame
         FRAME_LENGTH = 101
 
-        # Keep track of the previous frame so a row change can be detected
-        prev_frame = frame_list[0].copy()
+        # Index of each frame within the file's frames, which skip 2 frames whenever the row changes
+        frame_indices = get_frame_indices(frame_addrs)
 
-        # The first frame in a .ebd file is a dummy frame, skip it
-        for _ in range(FRAME_LENGTH):
-            eb_f.readline()
+        # Read in the remaining words at once so each frame can be accessed by its index
+        words = eb_f.read().split()
 
         # Iterate through each frame in the frame list
-        for frame in frame_list:
+        for frame_index, frame_hex in zip(frame_indices.tolist(), frame_hexes):
 
-            # Skip 2 frames worth of bits whenever the row changes
-            if prev_frame[1][17:23] != frame[1][17:23]:
-                for _ in range(FRAME_LENGTH*2):
-                    eb_f.readline()
+            # The first frame in a .ebd file is a dummy frame, skip it
+            word_cursor = (frame_index + 1) * FRAME_LENGTH
 
-             # Iterate for the number of words specified for this architecture's frame
+            # Iterate for the number of words specified for this architecture's frame
             for word_offset in range(FRAME_LENGTH):
 
-                word = eb_f.readline().strip()[::-1]
+                word = words[word_cursor + word_offset][::-1]
                 # Iterate through each bit in the word
                 for bit_offset, bit in enumerate(word):
                     # The first 13 bits of the 51st word per frame are reserved in series-7
@@ -111,11 +108,7 @@ def parse_ebd_file(eb_file:str):
 
                     # Add every high bit to the bits list
                     if bit == '1' and not in_clock_row_bits:
-                        word_offset_str = str(word_offset).rjust(3, "0")
-                        bit_offset_str = str(bit_offset).rjust(2, "0")
-                        essential_bits.append([frame[0], word_offset_str, bit_offset_str])
-
-            prev_frame = frame.copy()
+                        essential_bits.append([frame_hex, WORD_STR[word_offset], BIT_STR[bit_offset]])
 
     return essential_bits
 
@@ -135,14 +128,9 @@ def write_bit_list(essential_bits:list, num_bits:int, ebd_file:str):
         print(f"There is less than {num_bits} useable bits in the provided .ebd file.")
         num_bits = len(essential_bits)
 
-    # Add the specified number of bits to the fault bits list
-    while len(fault_bits) < num_bits: 
-        # Get a random bit and add it to the fault bit list
-        rand_bit = random.choice(essential_bits)
-        fault_bits.append([rand_bit])
-
-        # Remove the bit to avoid duplicates
-        essential_bits.remove(rand_bit)
+    # Add the specified number of randomly chosen bits (without duplicates) to the fault bits list
+    for bit_index in random.sample(range(len(essential_bits)), num_bits):
+        fault_bits.append([essential_bits[bit_index]])
 
     fault_bits_json = json.dumps(fault_bits, indent=4)   
 
@@ -317,12 +317,12 @@ def get_undefined_bit(part:str):
             Returns: list including the undefined bit
     '''
 
-    # Extract the string formatted frame list from the string/binary combo that the function returns
-    frame_list = [frame_list_extra[0] for frame_list_extra in get_frame_list(part)]
+    # Get the string formatted frame list from the address array/string list pair the function returns
+    frame_list = get_frame_list(part)[1]
 
     # Iterate through frame list until a gap in the addresses is found
     for index, frame_addr in enumerate(frame_list):
-        addr_plus_1 = hex(int(frame_addr, 16)+1)[2:].rjust(8, '0')
+        addr_plus_1 = f'{int(frame_addr, 16)+1:08x}'
         if frame_list[index+1] != addr_plus_1:
             frame_to_use = addr_plus_1
             break
@@ -491,8 +491,10 @@ def find_fault_bits(bitstream:str, dcp:str, run_bfat:bool, rpd:bool):
         bits_file_path = f'{bitstream}s'
         # Write design bits from bitread to a file so it can be passed in to bfat
         with open(bits_file_path, "w") as bits_file:
-            for bit in design_bits:
-                bits_file.write(bit + "\n")
+            # Join the bits into one string rather than writing each line separately
+            if design_bits:
+                bits_file.write("\n".join(design_bits))
+                bits_file.write("\n")
 
         # Bash command to run BFAT
         run_cmd = ["python3", "bfat.py", bits_file_path, dcp, fault_bits_file_path, '-bf']
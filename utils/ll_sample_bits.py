@@ -47,10 +47,17 @@ def parse_ll_file(ll_file:str):
     with open(ll_file) as ll_f:
         # Iterate through each line of the file
         for line in ll_f:
-            line_split = line.split()
-            
-            # Ignore lines that do not give bit information
-            if line_split[0] != 'Bit':
+            # Ignore lines that do not give bit information, checked on the raw line so they never need to be split
+            if not line.startswith('Bit '):
+                continue
+
+            # Only the fields up to the block name are needed
+            line_split = line.split(None, 5)
+
+            # Skip bits that are not in a SLICE block. This is newer behavior than the rest of the parser, it
+            # matches the documented skipping of BRAM bits (see docs/sample_bit_scripts.md). The block field
+            # is checked rather than the whole line so a net name containing 'SLICE' can't let a bit through
+            if 'SLICE' not in line_split[4]:
                 continue
 
             # Get frame address and bit offset from start of frame
@@ -58,8 +65,9 @@ def parse_ll_file(ll_file:str):
             full_offset = line_split[3]
 
             # Split full offset into a word offset and a bit offset from start of word
-            word_offset = str(int(full_offset) // 32)
-            bit_offset = str(int(full_offset) % 32)
+            word_offset, bit_offset = divmod(int(full_offset), 32)
+            word_offset = str(word_offset)
+            bit_offset = str(bit_offset)
 
             # Format the three address fields
             frame_addr = frame_addr.split('x')[1]
@@ -88,14 +96,9 @@ def write_bit_list(ll_bits:list, num_bits:int, ll_file:str):
         print(f"There is less than {num_bits} useable bits in the provided .ll file.")
         num_bits = len(ll_bits)
 
-    # Add the specified number of bits to the fault bits list
-    while len(fault_bits) < num_bits: 
-        # Get a random bit and add it to the fault bit list
-        rand_bit = random.choice(ll_bits)
-        fault_bits.append([rand_bit])
-
-        # Remove the bit to avoid duplicates
-        ll_bits.remove(rand_bit)
+    # Add the specified number of randomly chosen bits (without duplicates) to the fault bits list
+    for bit_index in random.sample(range(len(ll_bits)), num_bits):
+        fault_bits.append([ll_bits[bit_index]])
 
     fault_bits_json = json.dumps(fault_bits, indent=4)   
 